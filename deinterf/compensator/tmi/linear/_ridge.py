@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike
+from sklearn.utils.validation import check_X_y
+
+
+class RidgeGCV:
+    """多正则化系数岭回归，以广义交叉验证（GCV）选择正则化系数
+
+    拟合过程只累积充分统计量 XᵀX 、 Xᵀy 与 yᵀy ，所有候选正则化系数下的解与GCV得分
+    均在 (n_features, n_features) 规模的方程组上求得，计算量与样本数无关；
+    多次调用 `partial_fit` 即可分批累积数据进行拟合。
+    输入可以为单精度，充分统计量始终以双精度累积与求解。
+
+    Parameters
+    ----------
+    alphas : array-like of shape (n_alphas,)
+        候选正则化系数。
+
+    Attributes
+    ----------
+    coef_ : ndarray of shape (n_features,)
+        所选正则化系数下的回归系数。
+    alpha_ : float
+        GCV得分最小的正则化系数。
+    gram_ : ndarray of shape (n_features, n_features)
+        累积的 XᵀX 。
+    xty_ : ndarray of shape (n_features,)
+        累积的 Xᵀy 。
+    yty_ : float
+        累积的 yᵀy 。
+    n_samples_seen_ : int
+        累积的样本数。
+    """
+
+    def __init__(self, alphas: ArrayLike) -> None:
+        self.alphas = alphas
+
+    def _reset(self) -> None:
+        for attr in ("gram_", "xty_", "yty_", "n_samples_seen_"):
+            if hasattr(self, attr):
+                delattr(self, attr)
+
+    def fit(self, X: ArrayLike, y: ArrayLike) -> RidgeGCV:
+        self._reset()
+        return self.partial_fit(X, y)
+
+    def partial_fit(self, X: ArrayLike, y: ArrayLike) -> RidgeGCV:
+        # 单精度输入在此转为双精度后再求内积，避免 XᵀX 以单精度累加时的舍入误差
+        X, y = check_X_y(X, y, dtype=np.float64, y_numeric=True)
+
+        if not hasattr(self, "gram_"):
+            n_features = X.shape[1]
+            self.gram_ = np.zeros((n_features, n_features))
+            self.xty_ = np.zeros(n_features)
+            self.yty_ = 0.0
+            self.n_samples_seen_ = 0
+
+        self.gram_ += X.T @ X
+        self.xty_ += X.T @ y
+        self.yty_ += float(y @ y)
+        self.n_samples_seen_ += X.shape[0]
+
+        self._solve()
+
+        return self
+
+    def _solve(self) -> None:
+        # 对 XᵀX 做对称的列尺度均衡，避免量级悬殊的特征列使法方程病态
+        scale = np.sqrt(np.diag(self.gram_))
+        scale[scale == 0] = 1
+        gram = self.gram_ / np.outer(scale, scale)
+        xty = self.xty_ / scale
+        penalty = np.diag(1 / (scale * scale))
+        rhs = np.column_stack((xty, gram))
+
+        best_score, best_alpha, best_coef = np.inf, None, None
+        for alpha in np.asarray(self.alphas, dtype=np.float64):
+            sol = np.linalg.solve(gram + alpha * penalty, rhs)
+            coef = sol[:, 0]
+            # ‖y - Xβ‖² = yᵀy - 2βᵀXᵀy + βᵀXᵀXβ
+            rss = self.yty_ - 2 * coef @ xty + coef @ gram @ coef
+            dof = np.trace(sol[:, 1:])
+            score = rss / (self.n_samples_seen_ - dof) ** 2
+            if score < best_score:
+                best_score, best_alpha, best_coef = score, alpha, coef
+
+        if best_coef is None:
+            raise ValueError(
+                "No candidate alpha yields a finite GCV score; "
+                "check the input data and alphas."
+            )
+
+        self.alpha_ = best_alpha
+        self.coef_ = best_coef / scale
+
+    def predict(self, X: ArrayLike) -> np.ndarray:
+        return np.asarray(X) @ self.coef_
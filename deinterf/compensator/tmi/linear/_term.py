@@ -4,7 +4,71 @@ import numpy as np
 
 from deinterf.foundation import ComposableTerm
 from deinterf.foundation.sensors import DirectionalCosine, MagIntensity
-from deinterf.utils.data_ioc import DataIoC
+from deinterf.utils.data_ioc import DataIoC, DataNDArray
+
+X, Y, Z = 0, 1, 2
+
+
+class _WeightedDirectionalCosine(DataNDArray):
+    """总场强加权的方向余弦 intensity * cos ，由感应项与涡流项共享，在容器中只计算一次"""
+    @classmethod
+    def __build__(cls, container: DataIoC) -> _WeightedDirectionalCosine:
+        intensity = np.asarray(container[MagIntensity])
+        dir_cosine = np.asarray(container[DirectionalCosine])
+        return cls.from_2d(dir_cosine * intensity[:, None])
+
+
+class _DirectionalCosineRate(DataNDArray):
+    """方向余弦的时间导数，由各涡流项共享，在容器中只计算一次"""
+    @classmethod
+    def __build__(cls, container: DataIoC) -> _DirectionalCosineRate:
+        # 三轴方向余弦沿时间轴一次性求中心差分
+        return cls.from_2d(_gradient(np.asarray(container[DirectionalCosine])))
+
+
+def _gradient(f: np.ndarray) -> np.ndarray:
+    """沿第0维的单位间隔梯度，结果与 `np.gradient(f, axis=0)` 一致
+
+    差分直接写入预分配的输出并原地缩放，不产生 np.gradient 内部的差值与商两个临时数组
+    """
+    if len(f) < 2:
+        # 交由 np.gradient 给出一致的异常
+        return np.gradient(f, axis=0)
+
+    # 与 np.gradient 相同，浮点输入保持精度，其余类型提升为双精度
+    dtype = f.dtype if np.issubdtype(f.dtype, np.inexact) else np.float64
+    out = np.empty_like(f, dtype=dtype)
+    # 内部点为中心差分，两端为一阶单侧差分
+    np.subtract(f[2:], f[:-2], out=out[1:-1])
+    out[1:-1] *= 0.5
+    # 以长度为1的切片写入两端，对一维输入同样适用
+    np.subtract(f[1:2], f[:1], out=out[:1])
+    np.subtract(f[-1:], f[-2:-1], out=out[-1:])
+
+    return out
+
+
+def _products(lhs: np.ndarray, rhs: np.ndarray, pairs: tuple[tuple[int, int], ...]) -> np.ndarray:
+    """按 `pairs` 给出的列号组合计算 lhs[:, i] * rhs[:, j] ，只计算需要的列"""
+    # 预分配输出并逐列写入，避免中间临时数组与 column_stack 的额外拷贝；
+    # 输出按列优先存储，使每列的写入都是连续访存而非跨步写入
+    feats = np.empty((len(lhs), len(pairs)), dtype=np.result_type(lhs, rhs), order="F")
+    for col, (i, j) in enumerate(pairs):
+        np.multiply(lhs[:, i], rhs[:, j], out=feats[:, col])
+    return feats
+
+
+def _induced(container: DataIoC, pairs: tuple[tuple[int, int], ...]) -> np.ndarray:
+    # 总场强已并入左因子，每个输出列只需一次乘法
+    weighted = np.asarray(container[_WeightedDirectionalCosine])
+    dir_cosine = np.asarray(container[DirectionalCosine])
+    return _products(weighted, dir_cosine, pairs)
+
+
+def _eddy(container: DataIoC, pairs: tuple[tuple[int, int], ...]) -> np.ndarray:
+    weighted = np.asarray(container[_WeightedDirectionalCosine])
+    dir_cosine_dot = np.asarray(container[_DirectionalCosineRate])
+    return _products(weighted, dir_cosine_dot, pairs)
 
 
 class Permanent(ComposableTerm):
@@ -13,28 +77,18 @@ class Permanent(ComposableTerm):
 
 
 class Induced6(ComposableTerm):
+    pairs = ((X, X), (X, Y), (X, Z), (Y, Y), (Y, Z), (Z, Z))
+
     def __build__(self, container: DataIoC) -> np.ndarray:
-        intensity = container[MagIntensity]
-        cos_x, cos_y, cos_z = container[DirectionalCosine].T
-        # (n,) * (n, 6) -> (n, 6)
-        feats = intensity[:, None] * np.column_stack(
-            (
-                cos_x * cos_x,
-                cos_x * cos_y,
-                cos_x * cos_z,
-                cos_y * cos_y,  # removed in Induced_5 version
-                cos_y * cos_z,
-                cos_z * cos_z,
-            )
-        )
-        return feats
+        return _induced(container, self.pairs)
 
 
 class Induced5(ComposableTerm):
+    # removed cos_y * cos_y from Induced_6 version
+    pairs = ((X, X), (X, Y), (X, Z), (Y, Z), (Z, Z))
+
     def __build__(self, container: DataIoC) -> np.ndarray:
-        feats = container[Induced6]
-        feats = np.delete(feats, feats.shape[1] // 2, 1)
-        return feats
+        return _induced(container, self.pairs)
 
 
 class Induced(Induced5):
@@ -42,33 +96,19 @@ class Induced(Induced5):
 
 
 class Eddy9(ComposableTerm):
+    # cos_i * d(cos_j)/dt
+    pairs = ((X, X), (X, Y), (X, Z), (Y, X), (Y, Y), (Y, Z), (Z, X), (Z, Y), (Z, Z))
+
     def __build__(self, container: DataIoC) -> np.ndarray:
-        intensity = container[MagIntensity]
-        cos_x, cos_y, cos_z = container[DirectionalCosine].T
-        cos_x_dot = np.gradient(cos_x)
-        cos_y_dot = np.gradient(cos_y)
-        cos_z_dot = np.gradient(cos_z)
-        feats = intensity[:, None] * np.column_stack(
-            (
-                cos_x * cos_x_dot,
-                cos_x * cos_y_dot,
-                cos_x * cos_z_dot,
-                cos_y * cos_x_dot,
-                cos_y * cos_y_dot,  # removed in Eddy_8 version
-                cos_y * cos_z_dot,
-                cos_z * cos_x_dot,
-                cos_z * cos_y_dot,
-                cos_z * cos_z_dot,
-            )
-        )
-        return feats
+        return _eddy(container, self.pairs)
 
 
 class Eddy8(ComposableTerm):
+    # removed cos_y * d(cos_y)/dt from Eddy_9 version
+    pairs = ((X, X), (X, Y), (X, Z), (Y, X), (Y, Z), (Z, X), (Z, Y), (Z, Z))
+
     def __build__(self, container: DataIoC) -> np.ndarray:
-        feats = container[Eddy9]
-        feats = np.delete(feats, feats.shape[1] // 2, 1)
-        return feats
+        return _eddy(container, self.pairs)
 
 
 class Eddy(Eddy8): 
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 from numbers import Integral
+from typing import Sequence
 
 import numpy as np
-from scipy.signal import detrend
-from sklearn.base import BaseEstimator, OneToOneFeatureMixin, _fit_context
-from sklearn.linear_model import RidgeCV
+from sklearn.base import BaseEstimator, OneToOneFeatureMixin, _fit_context, clone
 from sklearn.preprocessing import StandardScaler
 from sklearn.utils._param_validation import Interval, StrOptions
+from sklearn.utils.parallel import Parallel, delayed
 from sklearn.utils.validation import check_consistent_length, check_is_fitted
 from typing_extensions import Literal, Self
 
+from deinterf.compensator.tmi.linear._ridge import RidgeGCV
 from deinterf.compensator.tmi.linear.terms import Terms
 from deinterf.foundation import ComposableTerm, Composition
 from deinterf.foundation.sensors import Tmi
@@ -47,44 +48,91 @@ class TollesLawson(OneToOneFeatureMixin, BaseEstimator):
             del self.model_
         if hasattr(self, "scaler_"):
             del self.scaler_
+        if hasattr(self, "coef_"):
+            del self.coef_
 
     @_fit_context(prefer_skip_nested_validation=True)
-    def fit(self, X: DataIoC, y: Tmi) -> Self:
+    def fit(self, X: DataIoC | np.ndarray, y: Tmi) -> Self:
         self._reset()
         return self.partial_fit(X, y)
 
     @_fit_context(prefer_skip_nested_validation=True)
-    def partial_fit(self, X: DataIoC, y: Tmi) -> Self:
-        measurement = y
-        tl_features = X[self.terms]
-        check_consistent_length(tl_features, measurement)
-
-        if self.norm:
-            self.scaler_ = StandardScaler()
-            tl_features = self.scaler_.fit_transform(tl_features)
+    def partial_fit(self, X: DataIoC | np.ndarray, y: Tmi) -> Self:
+        self._partial_fit(self._features(X), y)
+        return self
 
-        # 决定是计算Ax=b形式，还是bpf(Ax)=bpf(b)=>bpf(A)x=bpf(b)形式的模型
-        tl_features = (
-            fom_bpfilter(tl_features, sampling_rate=self.sampling_rate)
-            if self.filter == "bandpass"
-            else tl_features
+    def fit_many(
+        self,
+        Xs: Sequence[DataIoC | np.ndarray],
+        ys: Sequence[Tmi],
+        n_jobs: int | None = None,
+    ) -> list[TollesLawson]:
+        """以当前参数分别拟合多组相互独立的数据，例如多条测线
+
+        各组数据在各自的副本估计器上拟合，以线程并行执行，求解与滤波过程会释放GIL。
+        各组数据应使用各自独立的 `DataIoC` ，容器本身不是线程安全的。
+
+        Parameters
+        ----------
+        Xs : sequence of DataIoC or ndarray
+            各组数据的容器或补偿特征矩阵。
+        ys : sequence of Tmi
+            各组数据对应的磁总场测量值。
+        n_jobs : int, default=None
+            并行线程数，含义同 `joblib.Parallel` 。
+
+        Returns
+        -------
+        estimators : list of TollesLawson
+            与各组数据一一对应的已拟合估计器。
+        """
+        check_consistent_length(Xs, ys)
+        return Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(clone(self).fit)(X, y) for X, y in zip(Xs, ys)
         )
 
-        interf_measured = (
-            fom_bpfilter(measurement, sampling_rate=self.sampling_rate)
-            if self.filter == "bandpass"
-            else measurement
-        )
+    def _features(self, X: DataIoC | np.ndarray) -> np.ndarray:
+        if isinstance(X, np.ndarray):
+            # 已构造好的补偿特征（例如此前取出的 container[self.terms] ）直接使用，不再经过容器查找
+            return X
+        return X[self.terms]
 
-        self.model_ = RidgeCV(
-            fit_intercept=False,
-            alphas=np.logspace(-6, 6, 13),
-            cv=10,
-        ).fit(tl_features, interf_measured)
+    def _partial_fit(self, tl_features: np.ndarray, measurement: Tmi) -> None:
+        check_consistent_length(tl_features, measurement)
 
-        return self
+        if self.norm and not hasattr(self, "scaler_"):
+            # 以首批数据确定特征缩放，保证分批累积的统计量处于同一尺度下
+            self.scaler_ = StandardScaler().fit(tl_features)
 
-    def transform(self, X: DataIoC, y: Tmi) -> Tmi:
+        # 决定是计算Ax=b形式，还是bpf(Ax)=bpf(b)=>bpf(A)x=bpf(b)形式的模型
+        if self.filter == "bandpass":
+            # 特征与测量值拼接到同一缓冲区，标准化在其上原地完成，再整体一次性滤波，
+            # 不再为标准化后的特征单独分配 (n, p) 数组
+            stacked = np.column_stack((tl_features, measurement))
+            if self.norm:
+                stacked_features = stacked[:, :-1]
+                stacked_features -= self.scaler_.mean_
+                stacked_features /= self.scaler_.scale_
+            filtered = fom_bpfilter(stacked, sampling_rate=self.sampling_rate)
+            tl_features, interf_measured = filtered[:, :-1], filtered[:, -1]
+        else:
+            if self.norm:
+                tl_features = self.scaler_.transform(tl_features)
+            interf_measured = measurement
+
+        if not hasattr(self, "model_"):
+            self.model_ = RidgeGCV(alphas=np.logspace(-6, 6, 13))
+        self.model_.partial_fit(tl_features, interf_measured)
+
+        coef = self.model_.coef_
+        if self.norm:
+            # 将特征标准化并入回归系数：((x - μ) / σ)·β = x·(β / σ) - μ·(β / σ)，
+            # 其中常数项会在去除常值分量时抵消，因此预测时无需生成标准化后的 (n, p) 特征矩阵
+            coef = coef / self.scaler_.scale_
+        # 拟合时即确定作用于原始特征的等效系数，后续每次预测仅需一次矩阵-向量乘
+        self.coef_ = coef
+
+    def transform(self, X: DataIoC | np.ndarray, y: Tmi) -> Tmi:
         check_is_fitted(self)
         measurement = y
         interf = self.predict(X)
@@ -92,23 +140,32 @@ class TollesLawson(OneToOneFeatureMixin, BaseEstimator):
 
         return Tmi(tmi=comped)
 
-    def fit_transform(self, X: DataIoC, y: Tmi) -> Tmi:
-        return self.fit(X, y).transform(X, y)
+    @_fit_context(prefer_skip_nested_validation=True)
+    def fit_transform(self, X: DataIoC | np.ndarray, y: Tmi) -> Tmi:
+        measurement = y
+        interf = self.fit_predict(X, y)
+        comped = measurement - interf
+
+        return Tmi(tmi=comped)
 
-    def predict(self, X: DataIoC) -> Tmi:
+    def predict(self, X: DataIoC | np.ndarray) -> Tmi:
         check_is_fitted(self)
+        return Tmi(tmi=self._predict(self._features(X)))
 
-        tl_feats = X[self.terms]
-        if self.norm:
-            tl_feats = self.scaler_.transform(tl_feats)
+    def _predict(self, tl_feats: np.ndarray) -> np.ndarray:
+        pred = np.asarray(tl_feats) @ self.coef_
+        # 去除常值分量，等价于 detrend(pred, type="constant")
+        interf = pred - pred.mean(axis=0)
 
-        pred = self.model_.predict(tl_feats)
-        interf = detrend(pred, axis=0, type="constant")
+        return interf
 
-        return Tmi(tmi=interf)
+    @_fit_context(prefer_skip_nested_validation=True)
+    def fit_predict(self, X: DataIoC | np.ndarray, y: Tmi) -> Tmi:
+        self._reset()
+        tl_feats = self._features(X)
+        self._partial_fit(tl_feats, y)
 
-    def fit_predict(self, X: DataIoC, y: Tmi) -> Tmi:
-        return self.fit(X, y).predict(X)
+        return Tmi(tmi=self._predict(tl_feats))
 
     def _more_tags(self):
         return {
@@ -25,7 +25,10 @@ class Composition(ComposableTerm):
 
         _terms: list[ComposableTerm] = []
         for term in [terms, *other_terms]:
-            if isinstance(term, Iterable):
+            if isinstance(term, Composition):
+                # 嵌套组合直接展开其已扁平化的项，无需走通用迭代
+                _terms.extend(term.terms)
+            elif isinstance(term, Iterable):
                 _terms.extend(term)
             else:
                 _terms.append(term)
@@ -39,4 +42,14 @@ class Composition(ComposableTerm):
         yield from self.terms
 
     def __build__(self, container: DataIoC):
-        return np.column_stack([container[term] for term in self.terms])
+        feats = [np.asarray(container[term]) for term in self.terms]
+        widths = [1 if feat.ndim == 1 else feat.shape[1] for feat in feats]
+
+        # 一次性分配完整输出，各项依次拷贝到对应列区间
+        ret = np.empty((len(feats[0]), sum(widths)), dtype=np.result_type(*feats))
+        offset = 0
+        for feat, width in zip(feats, widths):
+            ret[:, offset:offset + width] = feat.reshape(len(feat), width)
+            offset += width
+
+        return ret
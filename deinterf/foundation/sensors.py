@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import numpy as np
 from numpy.typing import ArrayLike
 
 from deinterf.utils.data_ioc import DataNDArray, DataIoC
-from deinterf.utils.transform import magvec2dircosine, magvec2intensity
+from deinterf.utils.transform import _check_magvec, _magvec2intensity, _magvec2intensity_dircosine
 
 
 class MagVector(DataNDArray):
@@ -27,7 +26,8 @@ class MagVector(DataNDArray):
 class MagIntensity(DataNDArray):
     @classmethod
     def __build__(cls, container: DataIoC):
-        intensity = magvec2intensity(container[MagVector])
+        # 容器内部调用，跳过公开接口的参数校验
+        intensity = _magvec2intensity(_check_magvec(container[MagVector], copy=False))
         return cls(intensity)
 
 
@@ -42,13 +42,10 @@ class DirectionalCosine(DataNDArray):
 
     @classmethod
     def __build__(cls, container: DataIoC) -> DirectionalCosine:
-        dir_cosine = magvec2dircosine(container[MagVector])
-        dir_cosine_x, dir_cosine_y, dir_cosine_z = np.transpose(dir_cosine)
-        return cls(
-            dir_cosine_x=dir_cosine_x,
-            dir_cosine_y=dir_cosine_y,
-            dir_cosine_z=dir_cosine_z,
+        _, dir_cosine = _magvec2intensity_dircosine(
+            _check_magvec(container[MagVector], copy=False), inplace=False
         )
+        return cls.from_2d(dir_cosine)
 
     @property
     def dcosx(self):
@@ -64,8 +64,9 @@ def improve_rate(y_uncomp, y_comped, sampling_rate=10, verbose=False):
     y_uncomp = column_or_1d(y_uncomp, dtype=np.float64)
     y_comped = column_or_1d(y_comped, dtype=np.float64)
 
-    uncomped_noise_level = noise_level(y_uncomp, sampling_rate)
-    comped_noise_level = noise_level(y_comped, sampling_rate)
+    # 补偿前后信号拼接为两列，一次滤波同时得到二者的噪声水平
+    filtered = fom_bpfilter(np.column_stack((y_uncomp, y_comped)), sampling_rate=sampling_rate)
+    uncomped_noise_level, comped_noise_level = np.std(filtered, axis=0)
     if verbose:
         print(f"uncomped noise level: {uncomped_noise_level:.4f}")
         print(f"comped noise level: {comped_noise_level:.4f}")
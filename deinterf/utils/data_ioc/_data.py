@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import contextlib
 import copy
-import inspect
-from typing import Any, Dict, Protocol, Type, runtime_checkable, Callable, Generic, TypeVar, overload, Union
+import operator
+import weakref
+from typing import Any, Dict, Protocol, Type, Callable, Generic, TypeVar, overload, Union
 
 from typing_extensions import Self
 
 DataT = TypeVar('DataT')
 
+# 区分“未缓存”与“缓存值为None”
+_MISSING = object()
+
 
-@runtime_checkable
 class SupportsBuild(Protocol):
     def __build__(self, container: DataIoC) -> Any: ...
 
@@ -60,7 +63,7 @@ class DataDescriptor(Generic[DataT]):
     >>> print(container[OffsetSensor0[0]], container[OffsetSensor0[1]])
     [4, 4, 4] [5, 5, 5]
     """
-    __slots__ = ['_id']
+    __slots__ = ['_id', '_hash']
     DefaultWeakID = -1
     DefaultID = -DefaultWeakID - 1
 
@@ -77,6 +80,7 @@ class DataDescriptor(Generic[DataT]):
     @id.setter
     def id(self, val):
         self._id = val
+        self._hash = None
 
     @property
     def signed_id(self):
@@ -119,8 +123,19 @@ class DataDescriptor(Generic[DataT]):
         ret = self
         if not weak or self.is_weak_id:
             # 如果为强索引，或者当前为弱索引，则可以覆盖，重映射到新索引位置下的数据
-            ret = copy.copy(ret)
-            ret.id = new_index
+            ret = self._clone_with_id(new_index)
+
+        return ret
+
+    def _clone_with_id(self, new_id):
+        """直接复制各数据成员得到绑定到新id的副本，绕过 `copy.copy` 与基于 `params` 的反射式重建"""
+        ret = object.__new__(type(self))
+        for name in self._slot_names:
+            setattr(ret, name, getattr(self, name))
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict:
+            ret.__dict__.update(instance_dict)
+        ret.id = new_id
 
         return ret
 
@@ -140,28 +155,51 @@ class DataDescriptor(Generic[DataT]):
             return super().__class_getitem__(id, *args)
 
     def __hash__(self):
-        return hash(tuple(getattr(self, k) for k in self.keys))
+        # 描述符作为字典键使用后即视为不可变，哈希值在首次使用时计算并缓存，重新绑定id时失效
+        if self._hash is None:
+            self._hash = hash(tuple(getattr(self, k) for k in self.keys))
+        return self._hash
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if type(self) is not type(other):
             return False
 
-        for k in self.keys:
-            if getattr(self, k) != getattr(other, k):
-                return False
-        else:
-            return True
+        if self.id != other.id:
+            return False
+
+        slot_getter = self._slot_getter
+        if slot_getter is not None and slot_getter(self) != slot_getter(other):
+            return False
+
+        return getattr(self, '__dict__', None) == getattr(other, '__dict__', None)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._init_slot_cache()
+
+    @classmethod
+    def _init_slot_cache(cls):
+        """收集类型各层级 `__slots__` 中声明的成员，类型创建时计算一次并缓存"""
+        slots = set()
+        for c in reversed(cls.__mro__):
+            slots.update(getattr(c, '__slots__', []))
+
+        # 除id外的数据成员，克隆时逐个复制
+        cls._slot_names = tuple(sorted(slots - {'_id', '_hash', '__weakref__', '__dict__'}))
+        cls._slot_keys = frozenset(cls._slot_names) | {'id'}  # 保证 id 值恒为正
+        # 比较时一次性取出全部数据成员，代替逐键的 getattr 循环
+        cls._slot_getter = operator.attrgetter(*cls._slot_names) if cls._slot_names else None
 
     @property
     def keys(self):
-        keys = []
-        for c in reversed(inspect.getmro(type(self))):
-            keys.extend(getattr(c, '__slots__', []))
-        keys.extend(getattr(self, '__dict__', []))
-
-        keys = set(keys)
-        keys.remove('_id')
-        keys.add('id')  # 保证 id 值恒为正
+        keys = type(self)._slot_keys
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict:
+            # 未声明 `__slots__` 的子类可能带有实例属性，只有这部分需要逐次收集
+            keys = keys | instance_dict.keys()
 
         return keys
 
@@ -179,11 +217,32 @@ class DataDescriptor(Generic[DataT]):
         return f'{type(self).__name__}{id_str}({param_str})'
 
     def __copy__(self):
-        return type(self)(**self.params)
+        return self._clone_with_id(self._id)
+
+    def __getstate__(self):
+        # 缓存的哈希值依赖当前进程的哈希种子，不随对象序列化，反序列化后重新计算
+        slot_state = {'_id': self._id}
+        for name in self._slot_names:
+            if hasattr(self, name):
+                slot_state[name] = getattr(self, name)
+        instance_dict = getattr(self, '__dict__', None)
+
+        return dict(instance_dict) if instance_dict else None, slot_state
+
+    def __setstate__(self, state):
+        instance_dict, slot_state = state
+        if instance_dict:
+            self.__dict__.update(instance_dict)
+        for name, value in slot_state.items():
+            setattr(self, name, value)
+        self._hash = None
+
+
+DataDescriptor._init_slot_cache()
 
 
 class IndexedDataTypeDescriptor(DataDescriptor[DataT]):
-    __slots__ = ['_dtype']
+    __slots__ = ['_dtype', '__weakref__']
 
     @classmethod
     def of(cls, dtype, id=DataDescriptor.DefaultWeakID):
@@ -193,7 +252,24 @@ class IndexedDataTypeDescriptor(DataDescriptor[DataT]):
             return dtype(id)
         else:
             # 常规类型，不允许进行索引，强制绑定为默认索引
-            return cls(dtype, id=DataDescriptor.DefaultID)
+            return cls.interned(dtype, id=DataDescriptor.DefaultID)
+
+    @classmethod
+    def interned(cls, dtype, id=DataDescriptor.DefaultWeakID):
+        """获取 `dtype` 在 `id` 下的描述符，相同的 (dtype, id) 复用同一实例
+
+        Notes
+        -----
+        描述符在每次以类型访问 `DataIoC` 时都会被创建，复用实例可以省去重复的构造与哈希计算。
+        复用的实例被多处共享，不应再修改其成员。
+        """
+        key = (cls, dtype, id)
+        ret = _interned_type_descriptors.get(key)
+        if ret is None:
+            ret = cls(dtype, id=id)
+            _interned_type_descriptors[key] = ret
+
+        return ret
 
     def __init__(self, dtype: Type, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -218,6 +294,11 @@ class IndexedDataTypeDescriptor(DataDescriptor[DataT]):
         return f'{self.dtype.__name__}{id_str}'
 
 
+_interned_type_descriptors: weakref.WeakValueDictionary[tuple, IndexedDataTypeDescriptor] = (
+    weakref.WeakValueDictionary()
+)
+
+
 class DescribedData:
     def __init__(self, desc: DataDescriptor[DataT], data: DataT):
         self.desc = desc
@@ -240,8 +321,10 @@ class IndexedDataMeta(type):
         class_getitem = getattr(self, '__class_index__', None)
         if class_getitem is not None:
             return class_getitem(id, *args)
-        else:
+        elif args:
             return IndexedDataTypeDescriptor(self, *args, id=id)
+        else:
+            return IndexedDataTypeDescriptor.interned(self, id=id)
 
     def __repr__(self):
         return f'{self.__name__}'
@@ -255,7 +338,10 @@ class UniqueData:
     @classmethod
     def __class_index__(cls, id, *args):
         # 强制绑定为默认索引来保证所有隐式访问下会得到同一组数据
-        return IndexedDataTypeDescriptor(cls, *args, id=DataDescriptor.DefaultID)
+        if args:
+            return IndexedDataTypeDescriptor(cls, *args, id=DataDescriptor.DefaultID)
+        else:
+            return IndexedDataTypeDescriptor.interned(cls, id=DataDescriptor.DefaultID)
 
 
 class DataIoC:
@@ -329,9 +415,10 @@ class DataIoC:
 
     def __getitem__(self, dtype: Type[DataT] | DataDescriptor[DataT]) -> DataT:
         with self._logger.add(dtype):
-            ret = self._collection.get(dtype, None)
+            ret = self._collection.get(dtype, _MISSING)
 
-            if ret is None:
+            if ret is _MISSING:
+                ret = None
                 builder = self.find_builder(dtype)
 
                 if builder is None:
@@ -354,7 +441,7 @@ class DataIoC:
                         raise
 
                     self._logger.mark_new()
-                    self[dtype] = ret
+                    self._store(dtype, ret, overwrite_mirror=False)
 
         if self._logger.at_root and not self.record_all:
             self._logger.clear()
@@ -362,12 +449,18 @@ class DataIoC:
         return ret
 
     def __setitem__(self, data_type: Type[DataT] | DataDescriptor[DataT], data: DataT):
+        self._store(data_type, data)
+
+    def _store(self, data_type: Type[DataT] | DataDescriptor[DataT], data: DataT, overwrite_mirror=True):
         self._collection[data_type] = data
-        if isinstance(data_type, IndexedDataTypeDescriptor) and data_type.id == 0:
-            self._collection[data_type.dtype] = data
-        if isinstance(data_type, type):
-            # 对于直接用类名绑定，则默认同时绑定对应的0号数据
-            self._collection[IndexedDataTypeDescriptor.of(data_type)] = data
+        mirror_key = _mirror_key(data_type)
+        if mirror_key is not None:
+            if overwrite_mirror:
+                # 显式赋值需要覆盖等价键上的旧数据
+                self._collection[mirror_key] = data
+            else:
+                # 缓存构造结果时只补齐缺失的等价键，不覆盖已有数据
+                self._collection.setdefault(mirror_key, data)
 
     def find_builder(self, dtype: Type[DataT] | DataDescriptor[DataT]):
         """查找构造器
@@ -390,31 +483,49 @@ class DataIoC:
         return type(self).__name__
 
 
-class IndexedDataIoC(DataIoC):
+class IndexedDataIoC:
+    """按发起者索引重绑定键的容器视图
+
+    每次调用带上下文的构建器都会创建一个实例，因此不继承 `DataIoC` 、不分配实例字典，
+    索引号在创建时即确定。
+
+    Notes
+    -----
+    只有取值（ `__getitem__` ）会按索引重绑定键，其余属性（例如 `add` 、 `with_data` 、 `logger` ）
+    直接转发给底层容器，因此构建器在强索引与弱默认索引下可以同样地使用容器；
+    但 `isinstance(container, DataIoC)` 对该视图不成立，构建器不应依赖此判断。
+    """
+    __slots__ = ('_base_container', '_id')
+
     def __init__(self, base_container: DataIoC, initiator=None):
-        super().__init__()
         self._base_container = base_container
-        self._initiator = initiator
+        if initiator is None:
+            self._id = DataDescriptor.DefaultWeakID
+        else:
+            self._id = initiator.signed_id
 
     @property
     def id(self):
-        if self._initiator is None:
-            return DataDescriptor.DefaultWeakID
-        else:
-            return self._initiator.signed_id
+        return self._id
 
     def __getattr__(self, item):
+        # 仅在常规属性查找失败时调用，不影响 `__getitem__` 与 `id` 的访问开销
+        if item == '_base_container':
+            # 未初始化（例如复制或反序列化过程中）时避免无限递归
+            raise AttributeError(item)
         return getattr(self._base_container, item)
 
     def __getitem__(self, item: Type[DataT] | DataDescriptor[DataT]) -> DataT:
+        if self._id == DataDescriptor.DefaultWeakID:
+            # 弱默认索引下重绑定不会改变任何键，直接转发，省去描述符的复制与哈希
+            return self._base_container[item]
+
         if isinstance(item, type):
-            item = IndexedDataTypeDescriptor.of(item, id=self.id)
+            item = IndexedDataTypeDescriptor.of(item, id=self._id)
         elif isinstance(item, DataDescriptor):
-            item = item.index_implicit(self.id)
-
-        ret = self._base_container[item]
+            item = item.index_implicit(self._id)
 
-        return ret
+        return self._base_container[item]
 
 
 class _DataIoCDependency(list[tuple[Union[DataDescriptor, Type], '_DataIoCDependency']]):
@@ -583,6 +694,20 @@ class _DataIoCAccessLogger:
         return self.to_str()
 
 
+def _mirror_key(data_type: Type | DataDescriptor):
+    """与 data_type 指向同一数据的等价键，不存在时返回None
+
+    * 0号 IndexedDataTypeDescriptor 等价于其对应的类型
+
+    * 直接以类名绑定时，默认同时绑定对应的0号数据
+    """
+    if isinstance(data_type, IndexedDataTypeDescriptor):
+        return data_type.dtype if data_type.id == 0 else None
+    if isinstance(data_type, type):
+        return IndexedDataTypeDescriptor.of(data_type)
+    return None
+
+
 def _extract_builder_with_context(dtype: DataDescriptor | SupportsBuild | Callable, initiator=None):
     if initiator is None:
         if isinstance(dtype, DataDescriptor):
@@ -597,24 +722,23 @@ def _extract_builder_with_context(dtype: DataDescriptor | SupportsBuild | Callab
 
 
 def _extract_builder(dtype: DataDescriptor | SupportsBuild | Callable):
-    if isinstance(dtype, SupportsBuild):
-        builder = dtype.__build__
-    elif callable(dtype):
+    # 直接取属性而非对 Protocol 做 isinstance 检查，省去逐成员的运行时协议校验
+    builder = getattr(dtype, '__build__', None)
+    if builder is None and callable(dtype):
         # 类型的构造函数
         # 或者直接的构造器函数
         # TODO: 添加校验，验证可以用于DataIoC
         builder = dtype
-    else:
-        builder = None
 
     return builder
 
 
 def _bind_builder_context(builder, initiator):
-    if initiator is None:
+    if isinstance(builder, BuilderWithContext):
+        return builder if initiator is None else builder.with_initiator(initiator)
+    elif initiator is None or initiator.signed_id == DataDescriptor.DefaultWeakID:
+        # 弱默认索引下的上下文不会重映射任何访问，直接使用原构造器，省去每次构造时的容器包装
         return builder
-    elif isinstance(builder, BuilderWithContext):
-        return builder.with_initiator(initiator)
     else:
         return BuilderWithContext(initiator, builder)
 
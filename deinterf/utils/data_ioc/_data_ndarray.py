@@ -18,13 +18,62 @@ def is_homogeneous(inp: np.ndarray, out: np.ndarray):
     return True
 
 
+def _stack_columns(arrays: tuple[ArrayLike, ...], dtype=None) -> np.ndarray:
+    """将各列数据拼接为按列优先存储的二维数组
+
+    下游计算大多逐列读取，列优先存储下每列在内存中连续，同时仍保持 (n_samples, n_columns) 的数组接口
+    """
+    arrays = [np.asarray(a) for a in arrays]
+    if any(a.ndim != 1 for a in arrays):
+        # 含二维输入时保持 column_stack 的展开语义
+        return np.asarray(np.column_stack(arrays), dtype=dtype)
+
+    if dtype is None:
+        dtype = np.result_type(*arrays)
+    ret = np.empty((len(arrays[0]), len(arrays)), dtype=dtype, order='F')
+    for col, array in enumerate(arrays):
+        ret[:, col] = array
+
+    return ret
+
+
 class DataNDArray(np.ndarray, IndexedData):
-    def __new__(cls, *arrays: ArrayLike, force_column_stack=False, **kwargs):
-        check_consistent_length(*arrays)
+    def __new__(cls, *arrays: ArrayLike, force_column_stack=False, dtype=None, **kwargs):
+        """
+        Parameters
+        ----------
+        arrays
+            各列数据
+        force_column_stack
+            仅有一列数据时是否也将其组织为二维数组
+        dtype
+            数据类型，默认沿用输入数据的类型。可指定 `np.float32` 以减半内存占用与访存带宽，
+            但会降低补偿精度（视数据不同，补偿结果与双精度相差可达 0.1 nT 以上），仅建议在对精度不敏感时按需启用；
+            总场测量值等量级远大于待测信号的数据应保持双精度
+        """
+        if len(arrays) > 1:
+            # 仅有一列数据时无需检查长度一致性
+            check_consistent_length(*arrays)
         if force_column_stack or len(arrays) > 1:
-            return np.column_stack(arrays).view(cls)
+            return _stack_columns(arrays, dtype=dtype).view(cls)
         else:
-            return np.asarray(arrays[0]).view(cls)
+            return np.asarray(arrays[0], dtype=dtype).view(cls)
+
+    @classmethod
+    def from_2d(cls, array: ArrayLike):
+        """由按列排布的二维数组直接构造，省去逐列拆分再重新拼接的开销
+
+        Parameters
+        ----------
+        array : array-like of shape (n_samples, n_columns)
+            各列数据，需来自同一数组，因此不再检查各列长度是否一致
+        """
+        array = np.asarray(array)
+        if not (array.flags.c_contiguous or array.flags.f_contiguous):
+            array = np.ascontiguousarray(array)
+        if array.ndim != 2:
+            raise ValueError(f'Expected 2D array, got {array.ndim}D array instead.')
+        return array.view(cls)
 
     def __array_finalize__(self, obj, **__):
         pass
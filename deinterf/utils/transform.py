@@ -2,6 +2,7 @@ import numpy as np
 from numpy import ndarray
 from numpy.typing import ArrayLike
 from sklearn.utils._param_validation import validate_params
+from sklearn.utils import assert_all_finite
 from sklearn.utils.validation import check_array
 
 
@@ -20,14 +21,15 @@ def magvec2intensity(magvec: ArrayLike, copy=True) -> ndarray:
     ----------
     magvec : array-like of shape (n_samples, 3)
         磁矢量数据，第二维度对应 x, y, z 三轴
+    copy : bool, default=True
+        校验时是否复制输入数据
 
     Returns
     -------
     intensity : ndarray of shape (n_samples,)
         磁总场强数据
     """
-    magvec = check_array(magvec, ensure_min_features=3, copy=copy)
-    return np.linalg.norm(magvec, axis=1)
+    return _magvec2intensity(_validate_magvec(magvec, copy=copy))
 
 
 @validate_params(
@@ -45,20 +47,83 @@ def magvec2dircosine(magvec: ArrayLike, copy=True) -> ndarray:
     ----------
     magvec : array-like of shape (n_samples, 3)
         磁矢量数据，第二维度对应 x, y, z 三轴
+    copy : bool, default=True
+        为True时在输入数据的副本上原地计算，否则另行分配输出，输入数据均不会被修改
 
     Returns
     -------
     dir_cosine : ndarray of shape (n_samples, 3)
         姿态方向余弦，第二维度对应 x, y, z 三轴
     """
-    magvec = check_array(magvec, ensure_min_features=3, copy=copy)
+    # 直接调用内部实现，不再经过 magvec2intensity_dircosine 的参数校验包装
+    _, dir_cosine = _magvec2intensity_dircosine(_validate_magvec(magvec, copy=copy), inplace=copy)
+    return dir_cosine
 
-    bx, by, bz = np.transpose(magvec)
 
-    intensity = magvec2intensity(magvec)
+@validate_params(
+    {
+        "magvec": ["array-like"],
+        "copy": ["boolean"],
+    },
+    prefer_skip_nested_validation=True,
+)
+def magvec2intensity_dircosine(magvec: ArrayLike, copy=True) -> tuple[ndarray, ndarray]:
+    """
+    根据磁矢量同时计算磁总场强与姿态方向余弦，二者共享同一次求模计算
+
+    Parameters
+    ----------
+    magvec : array-like of shape (n_samples, 3)
+        磁矢量数据，第二维度对应 x, y, z 三轴
+    copy : bool, default=True
+        为True时在输入数据的副本上原地计算方向余弦，否则另行分配输出，输入数据均不会被修改
+
+    Returns
+    -------
+    intensity : ndarray of shape (n_samples,)
+        磁总场强数据
+    dir_cosine : ndarray of shape (n_samples, 3)
+        姿态方向余弦，第二维度对应 x, y, z 三轴
+    """
+    # copy=True 时 magvec 已是私有副本，直接原地归一化，不再分配输出数组
+    return _magvec2intensity_dircosine(_validate_magvec(magvec, copy=copy), inplace=copy)
+
+
+def _validate_magvec(magvec: ArrayLike, copy: bool) -> ndarray:
+    """公开接口使用的完整校验，包括对 NaN 与 inf 的检查"""
+    return check_array(
+        magvec, ensure_min_features=3, dtype=[np.float64, np.float32], copy=copy
+    )
+
+
+def _check_magvec(magvec: ArrayLike, copy: bool) -> ndarray:
+    """供容器内部构建器使用的校验，已是（行或列）连续的浮点二维数组且无需复制时，
+    只检查有限值后直接返回，跳过 `check_array` 的类型转换与复制等检查"""
+    if (
+        not copy
+        and isinstance(magvec, ndarray)
+        and magvec.ndim == 2
+        and magvec.shape[1] >= 3
+        and magvec.dtype in (np.float64, np.float32)
+        and (magvec.flags.c_contiguous or magvec.flags.f_contiguous)
+    ):
+        # 容器中的磁矢量直接来自用户输入，此处是其首个校验点，不能省略有限值检查
+        assert_all_finite(magvec, input_name="magvec")
+        return np.asarray(magvec)
+
+    return _validate_magvec(magvec, copy=copy)
+
+
+def _magvec2intensity(magvec: ndarray) -> ndarray:
+    # 等价于 np.linalg.norm(magvec, axis=1)，平方与求和在一次遍历中完成，不产生 (n, 3) 的平方临时数组
+    return np.sqrt(np.einsum("ij,ij->i", magvec, magvec))
+
+
+def _magvec2intensity_dircosine(magvec: ndarray, inplace: bool) -> tuple[ndarray, ndarray]:
+    intensity = _magvec2intensity(magvec)
 
-    dir_conise_x = bx / intensity
-    dir_conise_y = by / intensity
-    dir_conise_z = bz / intensity
+    # 以总场强倒数一次广播相乘代替逐轴相除与 column_stack 重组
+    inv_intensity = 1 / intensity
+    dir_cosine = np.multiply(magvec, inv_intensity[:, None], out=magvec if inplace else None)
 
-    return np.column_stack((dir_conise_x, dir_conise_y, dir_conise_z))
+    return intensity, dir_cosine
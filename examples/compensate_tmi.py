@@ -1,4 +1,6 @@
-import matplotlib.pyplot as plt
+import os
+
+import numpy as np
 from sgl2020 import Sgl2020
 
 from deinterf.compensator.tmi.linear import Terms, TollesLawson
@@ -22,11 +24,13 @@ if __name__ == "__main__":
     )
     flt_d = surv_d["1002.02"]
 
-    # 数据准备
-    tmi_with_interf = Tmi(tmi=flt_d["mag_3_uc"])
-    fom_data = DataIoC().add(
-        MagVector(bx=flt_d["flux_b_x"], by=flt_d["flux_b_y"], bz=flt_d["flux_b_z"])
+    # 数据准备，统一转换为连续的双精度数组，后续拟合与补偿过程中不再发生隐式转换与复制
+    bx, by, bz, tmi = (
+        np.ascontiguousarray(flt_d[name], dtype=np.float64)
+        for name in ["flux_b_x", "flux_b_y", "flux_b_z", "mag_3_uc"]
     )
+    tmi_with_interf = Tmi(tmi=tmi)
+    fom_data = DataIoC().add(MagVector(bx=bx, by=by, bz=bz))
 
     # 创建补偿器
     compensator = TollesLawson(terms=Terms.Terms_16)
@@ -41,6 +45,10 @@ if __name__ == "__main__":
     # 仅预测磁干扰
     interf = compensator.predict(fom_data)
 
+    # 也可以直接传入已构造好的补偿特征矩阵，跳过容器查找，适合反复调用的场景
+    tl_features = fom_data[compensator.terms]
+    interf = compensator.predict(tl_features)
+
     # 评估磁补偿性能
     comped_noise_level = noise_level(tmi_clean)
     print(f"{comped_noise_level=}")
@@ -48,8 +56,11 @@ if __name__ == "__main__":
     ir = improve_rate(tmi_with_interf, tmi_clean)
     print(f"{ir=}")
 
-    # 简要绘图
-    plt.plot(tmi_with_interf, label="tmi_with_interf")
-    plt.plot(tmi_clean, label="tmi_clean")
-    plt.legend()
-    plt.show()
+    # 简要绘图，设置环境变量 DEINTERF_PLOT=0 可在批处理或无显示环境下跳过，同时免去导入 matplotlib 的开销
+    if os.environ.get("DEINTERF_PLOT", "1") == "1":
+        import matplotlib.pyplot as plt
+
+        plt.plot(tmi_with_interf, label="tmi_with_interf")
+        plt.plot(tmi_clean, label="tmi_clean")
+        plt.legend()
+        plt.show()
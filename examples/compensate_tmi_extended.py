@@ -1,11 +1,10 @@
+import os
 from datetime import datetime, timedelta
 from typing import NamedTuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 import ppigrf
 from numpy.typing import ArrayLike
-from scipy.spatial.transform import Rotation as R
 from sgl2020 import Sgl2020
 
 from deinterf.compensator.tmi.linear import Terms, TollesLawson
@@ -49,18 +48,57 @@ class InertialAttitude(DataNDArray):
         return super().__new__(cls, yaw, pitch, roll)
 
 
-class InsDirectionalCosine(DirectionalCosine):
+class AttitudeTrig(DataNDArray):
+    """ENU坐标系下绕 x, y, z 三轴旋转角的余弦与正弦，依次为 (cos_x, cos_y, cos_z, sin_x, sin_y, sin_z)
+
+    三角函数是姿态解算中唯一的计算密集部分，作为数据由容器缓存后，同一测线的各次构造只需计算一次
+    """
     @classmethod
-    def __build__(cls, container: DataIoC) -> DirectionalCosine:
-        att_angle = container[InertialAttitude]  # (yaw, pitch, roll): DEN
+    def __build__(cls, container: DataIoC):
+        yaw, pitch, roll = np.deg2rad(container[InertialAttitude]).T  # (yaw, pitch, roll): DEN
         # DEN to ENU
-        att_angle = att_angle[:, [1, 2, 0]]
-        att_angle[:, 2] = -att_angle[:, 2]
+        angles = np.column_stack((pitch, roll, -yaw))
+        # 三轴角度整体求值，各只需一次 cos 与 sin 调用
+        return cls.from_2d(np.column_stack((np.cos(angles), np.sin(angles))))
+
+    @property
+    def cos(self):
+        return self[:, :3]
+
+    @property
+    def sin(self):
+        return self[:, 3:]
+
+
+def enu2bodyframe(vec: np.ndarray, cos: np.ndarray, sin: np.ndarray) -> np.ndarray:
+    """将ENU坐标系下的矢量转换到机体坐标系
 
-        r = R.from_euler("xyz", att_angle, degrees=True)
-        geo_bodyframe = r.apply(container[IGRF], inverse=True)
-        dcos = magvec2dircosine(geo_bodyframe)
-        return cls(*dcos.T)
+    等价于 `Rotation.from_euler("xyz", angles).apply(vec, inverse=True)` ，其中 `cos` 与 `sin` 为 `angles` 的余弦与正弦，
+    但直接以逐元素的三角函数表达式依次施加三个轴向旋转的逆，不构造四元数与逐样本的旋转矩阵
+    """
+    cx, cy, cz = cos.T
+    sx, sy, sz = sin.T
+
+    x, y, z = vec.T
+    x, y = cz * x + sz * y, cz * y - sz * x
+    x, z = cy * x - sy * z, sy * x + cy * z
+    y, z = cx * y + sx * z, cx * z - sx * y
+
+    # 按列优先存储，逐列写入均为连续访存
+    ret = np.empty((len(x), 3), dtype=x.dtype, order="F")
+    ret[:, 0], ret[:, 1], ret[:, 2] = x, y, z
+    return ret
+
+
+class InsDirectionalCosine(DirectionalCosine):
+    @classmethod
+    def __build__(cls, container: DataIoC) -> DirectionalCosine:
+        trig = container[AttitudeTrig]
+        # 旋转不改变矢量的模，因此先在ENU坐标系下归一化再转换到机体坐标系，
+        # 旋转结果即为方向余弦，省去机体坐标系下的中间磁矢量与再一次求模
+        geo_dcos = magvec2dircosine(container[IGRF], copy=False)
+        dcos = enu2bodyframe(geo_dcos, cos=trig.cos, sin=trig.sin)
+        return cls.from_2d(dcos)
 
 
 if __name__ == "__main__":
@@ -113,8 +151,12 @@ if __name__ == "__main__":
     ir_ins = improve_rate(tmi_with_interf, tmi_clean_ins, verbose=True)
     print(f"{ir_ins=}")
 
-    plt.plot(tmi_with_interf, label="tmi_with_interf")
-    plt.plot(tmi_clean_classic, label="tmi_clean_classic")
-    plt.plot(tmi_clean_ins, label="tmi_clean_ins")
-    plt.legend()
-    plt.show()
+    # DEINTERF_PLOT=0 时跳过绘图
+    if os.environ.get("DEINTERF_PLOT", "1") == "1":
+        import matplotlib.pyplot as plt
+
+        plt.plot(tmi_with_interf, label="tmi_with_interf")
+        plt.plot(tmi_clean_classic, label="tmi_clean_classic")
+        plt.plot(tmi_clean_ins, label="tmi_clean_ins")
+        plt.legend()
+        plt.show()